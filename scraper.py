@@ -4,11 +4,15 @@ Windows ISO Links Scraper for Massgrave Repository
 Extracts Windows version names, builds, languages, and download links from markdown files
 """
 
+import os
 import re
+import sys
 import json
-import requests
+import asyncio
+import aiohttp
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Base URLs
 BASE_RAW_URL = "https://raw.githubusercontent.com/massgravel/massgrave.dev/refs/heads/main/docs/"
@@ -28,19 +32,123 @@ MD_FILES = [
 # Files to scrape (Office)
 OFFICE_MD_FILE = "office_msi_links.md"
 
+# Output category per markdown file
+CATEGORY = {
+    "windows_11_links.md": "Windows 11",
+    "windows_10_links.md": "Windows 10",
+    "windows_7_links.md": "Windows 7",
+    "windows_8.1_links.md": "Windows 8.1",
+    "windows_arm_links.md": "Windows ARM",
+    "windows_ltsc_links.md": "Windows LTSC",
+    "windows_vista__links.md": "Windows Vista",
+    "windows_xp_links.md": "Windows XP",
+}
+
+# Below this payload size, parse in-process: worker startup would dominate
+PROCESS_POOL_THRESHOLD = 50_000
+
+# ETag cache so unchanged files come back as tiny 304 responses
+CACHE_DIR = ".cache"
+ETAGS_FILE = os.path.join(CACHE_DIR, "etags.json")
+
+# Pre-compiled patterns shared by the parsers below
+_RE_VALUE = re.compile(r'value="([^"]+)"')
+_RE_BUILD = re.compile(r'Build\s*-\s*(\d+(?:\.\d+)*)', re.IGNORECASE)
+_RE_ROW = re.compile(r'(?m)^\s*\|\s*([^|\n]+?)\s*\|\s*([^|\n]*(?:x64|x86|ARM64)[^|\n]*?)\s*\|\s*\[([^\]]+)\]\(([^)]+)\)')
+_RE_TABITEM = re.compile(
+    r'<TabItem[^>]*value="([^"]+)"[^>]*label="([^"]+)"[^>]*>(.*?)</TabItem>',
+    re.DOTALL
+)
+_RE_H2 = re.compile(r'(?m)^##\s+(.+?)\s*$')
+_RE_H2_OFFICE = re.compile(r'(?m)^##\s+(Office\s+\d{4})\s*$')
+
+# Shared copies of the handful of language/architecture strings that
+# repeat across thousands of download rows
+_INTERN: Dict[str, str] = {}
+
+
+def _i(s: str) -> str:
+    """Return a shared interned copy of a frequently repeated string."""
+    return _INTERN.setdefault(s, sys.intern(s))
+
+
+def _load_etags() -> Dict[str, str]:
+    """Load the filename -> ETag mapping from the cache directory."""
+    try:
+        with open(ETAGS_FILE, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_etags(etags: Dict[str, str]) -> None:
+    """Persist the filename -> ETag mapping to the cache directory."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(ETAGS_FILE, 'w', encoding='utf-8') as f:
+        json.dump(etags, f)
+
+
+async def fetch(session: aiohttp.ClientSession, filename: str,
+                etags: Dict[str, str]) -> str:
+    """Fetch markdown file content from GitHub.
 
-def fetch_markdown_content(filename: str) -> str:
-    """Fetch markdown file content from GitHub"""
+    Sends If-None-Match when a cached copy exists; a 304 answer is served
+    from .cache/<filename> without transferring the body again.
+    """
     url = BASE_RAW_URL + filename
     print(f"Fetching: {url}")
-    response = requests.get(url, timeout=30)
-    response.raise_for_status()
-    return response.text
+
+    cache_path = os.path.join(CACHE_DIR, filename)
+    headers = {}
+    etag = etags.get(filename)
+    if etag and os.path.exists(cache_path):
+        headers['If-None-Match'] = etag
+
+    async with session.get(url, timeout=aiohttp.ClientTimeout(total=30),
+                           headers=headers) as response:
+        if response.status == 304:
+            print(f"  Not modified: {filename} (using cached copy)")
+            with open(cache_path, encoding='utf-8') as f:
+                return f.read()
+
+        response.raise_for_status()
+        text = await response.text()
+
+    new_etag = response.headers.get('ETag')
+    if new_etag:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        etags[filename] = new_etag
+
+    return text
+
+
+async def fetch_all(filenames: List[str]) -> List[Any]:
+    """Fetch all markdown files concurrently over a single session.
+
+    Returns contents in the same order as filenames; failed fetches are
+    returned as the exception instance instead of raising.
+    """
+    # Small keep-alive pool: all fetches hit the same host, so a few warm
+    # TCP+TLS connections serve every request instead of one handshake each
+    etags = _load_etags()
+    connector = aiohttp.TCPConnector(limit=4, keepalive_timeout=30)
+    async with aiohttp.ClientSession(
+        connector=connector,
+        headers={'Accept-Encoding': 'gzip'}
+    ) as session:
+        contents = await asyncio.gather(
+            *[fetch(session, filename, etags) for filename in filenames],
+            return_exceptions=True
+        )
+    _save_etags(etags)
+    return contents
 
 
 def extract_version_name(tab_item_line: str) -> str:
     """Extract version name from TabItem value attribute"""
-    match = re.search(r'value="([^"]+)"', tab_item_line)
+    match = _RE_VALUE.search(tab_item_line)
     if match:
         return match.group(1)
     return "Unknown"
@@ -49,7 +157,7 @@ def extract_version_name(tab_item_line: str) -> str:
 def extract_build_number(content: str) -> str:
     """Extract build number from markdown content"""
     # Pattern: Build - 26200.6584 or Build - 7601.17514
-    match = re.search(r'Build\s*-\s*(\d+(?:\.\d+)*)', content, re.IGNORECASE)
+    match = _RE_BUILD.search(content)
     if match:
         return match.group(1)
     return "Unknown"
@@ -57,51 +165,22 @@ def extract_build_number(content: str) -> str:
 
 def extract_markdown_table_data(table_content: str) -> List[Dict[str, str]]:
     """Extract language, architecture, and links from markdown tables"""
-    results = []
-
-    # Split into lines and find table rows
-    lines = table_content.split('\n')
+    # One multiline scan over the whole blob; no per-line split, and
+    # separator/header/prose lines simply fail the row regex
+    return [
+        {
+            "language": _i(m.group(1)),
+            "architecture": _i(m.group(2)),
+            "filename": m.group(3),
+            "url": m.group(4)
+        }
+        for m in _RE_ROW.finditer(table_content)
+    ]
 
-    for line in lines:
-        # Skip separator lines and header
-        if '|:--' in line or line.strip().startswith('| Language'):
-            continue
 
-        # Match table rows with data
-        if '|' in line and ('x64' in line or 'x86' in line or 'ARM64' in line):
-            cells = [cell.strip() for cell in line.split('|') if cell.strip()]
-
-            if len(cells) >= 3:
-                language = cells[0]
-                arch = cells[1]
-                link_cell = cells[2]
-
-                # Extract URL from markdown link [text](url)
-                url_match = re.search(r'\[([^\]]+)\]\(([^\)]+)\)', link_cell)
-                if url_match:
-                    filename = url_match.group(1)
-                    url = url_match.group(2)
-
-                    results.append({
-                        "language": language,
-                        "architecture": arch,
-                        "filename": filename,
-                        "url": url
-                    })
-
-    return results
-
-
-def extract_tabitems_with_content(section: str) -> List[Dict[str, Any]]:
-    """Extract TabItem blocks (value, label, inner content) from a section."""
-    items: List[Dict[str, Any]] = []
-    for value, label, inner in re.findall(r'<TabItem[^>]*value=\"([^\"]+)\"[^>]*label=\"([^\"]+)\"[^>]*>(.*?)</TabItem>', section, re.DOTALL):
-        items.append({
-            "value": value,
-            "label": label,
-            "content": inner,
-        })
-    return items
+def _iter_tabitems(section: str):
+    """Iterate TabItem matches in a section; groups are (value, label, inner)."""
+    return _RE_TABITEM.finditer(section)
 
 
 def parse_headings_versions(content: str) -> List[Dict[str, Any]]:
@@ -111,15 +190,16 @@ def parse_headings_versions(content: str) -> List[Dict[str, Any]]:
     like '## Windows XP SP3 VL (x86)', parse the following table.
     """
     versions: List[Dict[str, Any]] = []
-    headings = list(re.finditer(r'(?m)^##\s+(.+?)\s*$', content))
-    if not headings:
-        return versions
 
-    for i, m in enumerate(headings):
-        title = m.group(1).strip()
-        start = m.end()
-        end = headings[i + 1].start() if i + 1 < len(headings) else len(content)
-        section = content[start:end]
+    # Walk headings pairwise without materializing the match list
+    headings = _RE_H2.finditer(content)
+    prev = next(headings, None)
+    while prev is not None:
+        nxt = next(headings, None)
+        title = prev.group(1)  # _RE_H2 already trims surrounding whitespace
+        end = nxt.start() if nxt is not None else len(content)
+        section = content[prev.end():end]
+        prev = nxt
 
         downloads = extract_markdown_table_data(section)
         if not downloads:
@@ -138,41 +218,34 @@ def parse_headings_versions(content: str) -> List[Dict[str, Any]]:
 
 def parse_windows_versions(content: str) -> List[Dict[str, Any]]:
     """Parse all Windows versions from a markdown file"""
+    # Files without MDX Tabs (e.g., Windows XP) skip the TabItem pass entirely
+    if '<TabItem' not in content:
+        return parse_headings_versions(content)
+
     versions = []
 
-    # Split content by TabItem tags
-    tab_items = re.findall(
-        r'<TabItem[^>]*value="([^"]+)"[^>]*label="([^"]+)"[^>]*>.*?</TabItem>',
-        content,
-        re.DOTALL
-    )
+    # Single pass over TabItem tags; the inner content is captured directly
+    for match in _iter_tabitems(content):
+        value, label, tab_content = match.groups()
 
-    for value, label in tab_items:
         # Skip non-version tabs
         if 'Other Versions' in value or 'Other Versions' in label:
             continue
 
-        # Find the content for this TabItem
-        pattern = rf'<TabItem[^>]*value="{re.escape(value)}"[^>]*>(.*?)</TabItem>'
-        match = re.search(pattern, content, re.DOTALL)
-
-        if match:
-            tab_content = match.group(1)
-
-            # Extract build number
-            build = extract_build_number(tab_content)
+        # Extract build number
+        build = extract_build_number(tab_content)
 
-            # Extract table data
-            downloads = extract_markdown_table_data(tab_content)
+        # Extract table data
+        downloads = extract_markdown_table_data(tab_content)
 
-            if downloads:
-                version_data = {
-                    "version_name": value,
-                    "version_label": label,
-                    "build": build,
-                    "downloads": downloads
-                }
-                versions.append(version_data)
+        if downloads:
+            version_data = {
+                "version_name": value,
+                "version_label": label,
+                "build": build,
+                "downloads": downloads
+            }
+            versions.append(version_data)
 
     # Fallback for files without MDX Tabs (e.g., Windows XP)
     if not versions:
@@ -188,27 +261,31 @@ def parse_office_sections(content: str) -> Dict[str, List[Dict[str, Any]]]:
     """
     office_data: Dict[str, List[Dict[str, Any]]] = {}
 
-    # Find H2 headings like '## Office 2016', '## Office 2013', etc.
-    headings = list(re.finditer(r'(?m)^##\s+(Office\s+\d{4})\s*$', content))
-    if not headings:
+    # Cheap token test before running the heading regex at all
+    if '## Office' not in content:
         return office_data
 
-    for i, m in enumerate(headings):
-        category = m.group(1).strip()
-        start = m.end()
-        end = headings[i + 1].start() if i + 1 < len(headings) else len(content)
-        section = content[start:end]
+    # Find H2 headings like '## Office 2016', '## Office 2013', etc.,
+    # walking them pairwise without materializing the match list
+    headings = _RE_H2_OFFICE.finditer(content)
+    prev = next(headings, None)
+    while prev is not None:
+        nxt = next(headings, None)
+        category = prev.group(1)  # _RE_H2_OFFICE already trims whitespace
+        end = nxt.start() if nxt is not None else len(content)
+        section = content[prev.end():end]
+        prev = nxt
 
-        tabitems = extract_tabitems_with_content(section)
         versions: List[Dict[str, Any]] = []
-        for ti in tabitems:
-            downloads = extract_markdown_table_data(ti["content"])
+        for match in _iter_tabitems(section):
+            value, label, inner = match.groups()
+            downloads = extract_markdown_table_data(inner)
             if not downloads:
                 continue
-            build = extract_build_number(ti["content"])  # typically Unknown for Office
+            build = extract_build_number(inner)  # typically Unknown for Office
             versions.append({
-                "version_name": ti["value"],
-                "version_label": ti["label"],
+                "version_name": value,
+                "version_label": label,
                 "build": build,
                 "downloads": downloads,
             })
@@ -219,46 +296,50 @@ def parse_office_sections(content: str) -> Dict[str, List[Dict[str, Any]]]:
     return office_data
 
 
+def _parse_windows_contents(contents: List[Any]) -> List[List[Dict[str, Any]]]:
+    """Parse fetched Windows payloads, fanning out to worker processes.
+
+    The parses are independent and pure, so large payloads are farmed out
+    to a ProcessPoolExecutor; small runs stay in-process where pool
+    startup would cost more than the parsing. Fetch-stage exceptions pass
+    through as empty results.
+    """
+    texts = [c if isinstance(c, str) else '' for c in contents]
+
+    if not any(len(text) >= PROCESS_POOL_THRESHOLD for text in texts):
+        return [parse_windows_versions(text) for text in texts]
+
+    with ProcessPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+        return list(executor.map(parse_windows_versions, texts))
+
+
 def scrape_all_windows_versions() -> Dict[str, Any]:
     """Scrape all Windows versions from all markdown files"""
     all_data = {
-        "last_updated": datetime.utcnow().isoformat() + "Z",
+        "last_updated": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
         "source": "https://github.com/massgravel/massgrave.dev",
         "windows_versions": {},
         "office_versions": {}
     }
 
-    for md_file in MD_FILES:
+    # Fetch every markdown file concurrently, Office included
+    contents = asyncio.run(fetch_all(MD_FILES + [OFFICE_MD_FILE]))
+
+    # Parse the Windows payloads (across cores when they are big enough)
+    parsed = _parse_windows_contents(contents[:len(MD_FILES)])
+
+    for md_file, content, versions in zip(MD_FILES, contents, parsed):
         try:
             print(f"\n{'='*60}")
             print(f"Processing: {md_file}")
             print(f"{'='*60}")
 
-            # Fetch content
-            content = fetch_markdown_content(md_file)
-
-            # Parse versions
-            versions = parse_windows_versions(content)
+            if isinstance(content, Exception):
+                raise content
 
             # Determine Windows category
-            if 'windows_11' in md_file:
-                category = "Windows 11"
-            elif 'windows_10' in md_file:
-                category = "Windows 10"
-            elif 'windows_7' in md_file:
-                category = "Windows 7"
-            elif 'windows_8.1' in md_file:
-                category = "Windows 8.1"
-            elif 'windows_arm' in md_file:
-                category = "Windows ARM"
-            elif 'windows_ltsc' in md_file:
-                category = "Windows LTSC"
-            elif 'windows_vista' in md_file:
-                category = "Windows Vista"
-            elif 'windows_xp' in md_file:
-                category = "Windows XP"
-            else:
-                category = md_file.replace('_links.md', '').replace('_', ' ').title()
+            category = CATEGORY.get(md_file) or \
+                md_file.replace('_links.md', '').replace('_', ' ').title()
 
             if versions:
                 all_data["windows_versions"][category] = versions
@@ -272,17 +353,22 @@ def scrape_all_windows_versions() -> Dict[str, Any]:
             print(f"✗ Error processing {md_file}: {str(e)}")
             continue
 
+    # Office file was fetched in the same gather; parse it last
+    scrape_office_versions(all_data, contents[-1])
+
     return all_data
 
 
-def scrape_office_versions(all_data: Dict[str, Any]) -> None:
-    """Fetch and parse Office MSI links and add to all_data in-place."""
+def scrape_office_versions(all_data: Dict[str, Any], content: Any) -> None:
+    """Parse pre-fetched Office MSI links and add to all_data in-place."""
     try:
         print(f"\n{'='*60}")
         print(f"Processing: {OFFICE_MD_FILE}")
         print(f"{'='*60}")
 
-        content = fetch_markdown_content(OFFICE_MD_FILE)
+        if isinstance(content, Exception):
+            raise content
+
         office_map = parse_office_sections(content)
 
         if office_map:
@@ -307,16 +393,15 @@ def main():
     print("=" * 60)
 
     try:
-        # Scrape all data
+        # Scrape all data (Windows + Office)
         data = scrape_all_windows_versions()
 
-        # Scrape Office data and merge
-        scrape_office_versions(data)
-
-        # Save to JSON
+        # Save to JSON; compact separators keep the encoder on the C fast
+        # path (indent forces the pure-Python encoder) and the large buffer
+        # cuts write syscalls
         output_file = "windows_iso_links.json"
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
 
         print(f"\n{'='*60}")
         print(f"✓ Successfully saved data to {output_file}")